@@ -3,12 +3,16 @@ import os
 import subprocess
 import sys
 from abc import ABC
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 
 import platformdirs
 
 from opm.core.package import Package
 
 appname = 'opm'
+user_data_dir = platformdirs.user_data_dir(appname)
 
 logger = logging.getLogger(__name__)
 
@@ -16,22 +20,22 @@ logger = logging.getLogger(__name__)
 class Host(ABC):
     name: str
     version: str
+    dirnames: tuple[str, ...] = ('cache', 'manifests')
 
-    @property
+    @cached_property
     def data_dir(self) -> str:
-        user_data_dir = platformdirs.user_data_dir(appname)
         host_name = f'{self.name}_{self.version}'
         return os.path.join(user_data_dir, host_name)
 
-    @property
+    @cached_property
     def sys_python(self) -> str:
         return sys.executable
 
-    @property
+    @cached_property
     def venv_path(self) -> str:
         return os.path.join(self.data_dir, 'venv')
 
-    @property
+    @cached_property
     def venv_python(self) -> str:
         venv_bin_dir = 'Scripts' if sys.platform == 'win32' else 'bin'
         return os.path.join(self.venv_path, venv_bin_dir, 'python')
@@ -43,15 +47,8 @@ class Host(ABC):
             self.create_venv()
             self.upgrade_pip()
 
-        dirnames = ('repos',)
-
-        cache_path = os.path.join(self.data_dir, 'cache')
-        if not os.path.exists(cache_path):
-            os.makedirs(cache_path)
-
-        cache_path = os.path.join(self.data_dir, 'manifests')
-        if not os.path.exists(cache_path):
-            os.makedirs(cache_path)
+        for dirname in self.dirnames:
+            os.makedirs(os.path.join(self.data_dir, dirname), exist_ok=True)
 
         logger.info(f'Installed Host {self.name!r}')
 
@@ -66,3 +63,18 @@ class Host(ABC):
         logger.info(f'Upgraded pip: {self.venv_path!r}')
 
     def install_package(self, package: Package) -> None: ...
+
+
+def install_hosts(hosts: Sequence[Host]) -> None:
+    """
+    Installs multiple hosts concurrently. Creating the virtual environments is
+    mostly spent waiting on subprocesses, so threads are sufficient.
+    """
+    if not hosts:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+        futures = [executor.submit(host.install) for host in hosts]
+
+    for future in futures:
+        future.result()
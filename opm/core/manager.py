@@ -1,23 +1,66 @@
-import io
 import os.path
 import shutil
+import tempfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from opm.core.package import Package
 
+REPO_URL = 'https://github.com/beatreichenbach/qt-logging/archive/refs/heads/main.zip'
+MAX_DOWNLOADS = 16
+CHUNK_SIZE = 1 << 16
+TIMEOUT = 30
+
+# NOTE: A shared session keeps connections alive between downloads, so repeated
+#  requests to the same host don't pay for a new TLS handshake.
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=MAX_DOWNLOADS,
+    pool_maxsize=MAX_DOWNLOADS,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+)
+session.mount('http://', adapter)
+session.mount('https://', adapter)
+
 
 def get_remote_packages() -> tuple[Package, ...]:
     packages = ()
     return packages
 
 
-def get_repo(target: str) -> None:
-    url = 'https://github.com/beatreichenbach/qt-logging/archive/refs/heads/main.zip'
-    response = requests.get(url)
+def get_repo(target: str, url: str = REPO_URL) -> None:
+    # Stream the archive to disk instead of holding the whole zip in memory.
+    with tempfile.TemporaryFile() as file:
+        with session.get(url, stream=True, timeout=TIMEOUT) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                file.write(chunk)
+
+        if os.path.exists(target):
+            shutil.rmtree(target)
+
+        with zipfile.ZipFile(file) as zip_ref:
+            zip_ref.extractall(target)
+
+
+def get_repos(targets: dict[str, str]) -> None:
+    """
+    Download and extract multiple repos concurrently. `targets` maps the target
+    directory to the url of the repo.
+    """
+    if not targets:
+        return
 
-    if os.path.exists(target):
-        shutil.rmtree(target)
+    max_workers = min(len(targets), MAX_DOWNLOADS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(get_repo, target, url) for target, url in targets.items()
+        ]
 
-    with zipfile.ZipFile(io.BytesIO(response.content)) as zip_ref:
-        zip_ref.extractall(target)
+    # NOTE: All downloads finish before the first error is raised.
+    for future in futures:
+        future.result()
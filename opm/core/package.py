@@ -5,7 +5,7 @@ from collections.abc import Sequence
 class Package: ...
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Component:
     name: str
     dependencies: Sequence = ()
@@ -1,8 +1,7 @@
 import logging
 import os
 import sys
-
-import nuke
+from functools import cached_property
 
 from opm.core.host import Host
 
@@ -11,17 +10,16 @@ logger = logging.getLogger(__name__)
 
 class NukeHost(Host):
     name = 'nuke'
-    version = nuke.NUKE_VERSION_MAJOR
+    dirnames = (*Host.dirnames, 'gizmos', 'toolsets', 'plugins')
+
+    @cached_property
+    def version(self) -> str:
+        # NOTE: Import nuke on first access so the class can be imported without it.
+        import nuke
+
+        return str(nuke.NUKE_VERSION_MAJOR)
 
-    @property
+    @cached_property
     def sys_python(self) -> str:
         bin_dir = os.path.dirname(sys.executable)
         return os.path.join(bin_dir, 'python')
-
-    def install(self) -> None:
-        super().install()
-
-        for extra_dir in ('gizmos', 'toolsets', 'plugins'):
-            path = os.path.join(self.data_dir, extra_dir)
-            if not os.path.exists(path):
-                os.makedirs(path)
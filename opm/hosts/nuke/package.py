@@ -3,31 +3,31 @@ import dataclasses
 from opm.core.package import Component
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Gizmo(Component):
     target: str = 'gizmos'
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Script(Component):
     target: str = 'scripts'
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Template(Component):
     target: str = 'templates'
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Toolset(Component):
     target: str = 'toolsets'
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Init(Component):
     target: str = 'init'
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Menu(Component):
     target: str = 'menu'
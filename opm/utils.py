@@ -1,6 +1,24 @@
-import re
+import string
+from functools import lru_cache
 
+LOWERCASE_DIGITS = frozenset(string.ascii_lowercase + string.digits)
+UPPERCASE = frozenset(string.ascii_uppercase)
 
+
+@lru_cache(maxsize=1024)
 def title(text: str) -> str:
-    text = re.sub(r'([a-z0-9])([A-Z])', r'\g<1> \g<2>', text).replace('_', ' ').title()
+    # Most names are snake case, without uppercase letters there is no boundary.
+    if text.islower():
+        return text.replace('_', ' ').title()
+
+    # Insert a space at every camel case boundary, a single pass over the string
+    # is cheaper than a regex substitution for short identifiers.
+    characters = []
+    previous = ''
+    for character in text:
+        if character in UPPERCASE and previous in LOWERCASE_DIGITS:
+            characters.append(' ')
+        characters.append(character)
+        previous = character
+    text = ''.join(characters).replace('_', ' ').title()
     return text
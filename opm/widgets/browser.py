@@ -5,10 +5,10 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 from functools import partial
 
-from qt_material_icons import MaterialIcon
 from qtpy import QtCore, QtGui, QtWidgets
 
 from .filter import FilterListWidget, FilterWidget
+from .icons import get_icon
 from .tree import (
     ElementTree,
     Field,
@@ -20,7 +20,7 @@ from .tree import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     field: Field
     delegate: QtWidgets.QItemDelegate | None = None
@@ -37,7 +37,7 @@ class SearchLineEdit(QtWidgets.QLineEdit):
         self.setClearButtonEnabled(True)
         clear_button = self.findChild(QtWidgets.QToolButton)
         if isinstance(clear_button, QtWidgets.QToolButton):
-            icon = MaterialIcon('close')
+            icon = get_icon('close')
             clear_button.setIcon(icon)
 
 
@@ -123,12 +123,12 @@ class Browser(QtWidgets.QWidget):
         return tuple(self._columns)
 
     def selected_elements(self) -> tuple:
-        elements = []
+        # NOTE: QSortFilterProxyModel.mapSelectionToSource maps every selected cell,
+        #  mapping only the selected rows is cheaper.
+        map_to_source = self.proxy.mapToSource
+        element = self.model.element
         indexes = self.tree.selectionModel().selectedRows()
-        for index in indexes:
-            model_index = self.proxy.mapToSource(index)
-            elements.append(self.model.element(model_index))
-        return tuple(elements)
+        return tuple(element(map_to_source(index)) for index in indexes)
 
     def set_selected_elements(self, elements: Sequence) -> None:
         selection_model = self.tree.selectionModel()
@@ -154,14 +154,18 @@ class Browser(QtWidgets.QWidget):
         self.tree.resize_columns()
 
     def _refresh_columns(self) -> None:
-        for i, column in enumerate(self._columns):
-            self.tree.setColumnHidden(i, not (column.enabled and column.visible))
+        # Hide all columns in one pass so the view only updates once.
+        self.tree.setUpdatesEnabled(False)
+        try:
+            for i, column in enumerate(self._columns):
+                self.tree.setColumnHidden(i, not (column.enabled and column.visible))
+        finally:
+            self.tree.setUpdatesEnabled(True)
 
     def _selection_changed(self) -> None:
         proxy_indexes = self.tree.selectionModel().selectedRows()
-        indexes = tuple(self.proxy.mapToSource(index) for index in proxy_indexes)
-        if indexes:
-            element = self.model.element(indexes[0])
+        if proxy_indexes:
+            element = self.model.element(self.proxy.mapToSource(proxy_indexes[0]))
         else:
             element = None
         self.selection_changed.emit(element)
@@ -173,6 +177,8 @@ class FilterBrowser(Browser):
 
         self._groups = ()
         self._group = None
+        self._group_actions: list[QtWidgets.QAction] = []
+        self._field_actions: dict[int, QtWidgets.QAction] = {}
 
         self._init_toolbar()
         self._init_filters()
@@ -207,18 +213,18 @@ class FilterBrowser(Browser):
         sort_button = QtWidgets.QPushButton()
         sort_button.setAutoDefault(False)
         sort_button.setText('Sort')
-        sort_button.setIcon(MaterialIcon('sort'))
+        sort_button.setIcon(get_icon('sort'))
 
         menu = QtWidgets.QMenu(parent=sort_button)
         sort_button.setMenu(menu)
 
         action = QtWidgets.QAction('Ascending', parent=sort_button)
-        action.setIcon(MaterialIcon('keyboard_arrow_up'))
+        action.setIcon(get_icon('keyboard_arrow_up'))
         func = partial(self.set_sort_order, QtCore.Qt.SortOrder.AscendingOrder)
         action.triggered.connect(func)
         menu.addAction(action)
         action = QtWidgets.QAction('Descending', parent=sort_button)
-        action.setIcon(MaterialIcon('keyboard_arrow_down'))
+        action.setIcon(get_icon('keyboard_arrow_down'))
         func = partial(self.set_sort_order, QtCore.Qt.SortOrder.DescendingOrder)
         action.triggered.connect(func)
         menu.addAction(action)
@@ -229,18 +235,43 @@ class FilterBrowser(Browser):
         self.groups_button = QtWidgets.QPushButton()
         self.groups_button.setAutoDefault(False)
         self.groups_button.setText('Group')
-        self.groups_button.setIcon(MaterialIcon('view_agenda'))
+        self.groups_button.setIcon(get_icon('view_agenda'))
         self.groups_button.setVisible(False)
         self.toolbar_layout.addWidget(self.groups_button)
 
+        menu = QtWidgets.QMenu(parent=self.groups_button)
+        self.groups_button.setMenu(menu)
+
+        self.groups_action_group = QtWidgets.QActionGroup(self)
+        self.groups_action_group.triggered.connect(self._group_action_triggered)
+        action = QtWidgets.QAction('None', parent=self)
+        action.setCheckable(True)
+        self.groups_action_group.addAction(action)
+        menu.addAction(action)
+
         # Columns
         self.fields_button = QtWidgets.QPushButton()
         self.fields_button.setAutoDefault(False)
         self.fields_button.setText('Columns')
-        self.fields_button.setIcon(MaterialIcon('view_column'))
+        self.fields_button.setIcon(get_icon('view_column'))
         self.fields_button.setVisible(False)
         self.toolbar_layout.addWidget(self.fields_button)
 
+        menu = QtWidgets.QMenu(parent=self.fields_button)
+        self.fields_button.setMenu(menu)
+
+        self.fields_action_group = QtWidgets.QActionGroup(self)
+        self.fields_action_group.setExclusive(False)
+        self.fields_action_group.triggered.connect(self._field_action_triggered)
+
+        self._fields_separator = menu.addSeparator()
+        action = QtWidgets.QAction('Show All', parent=self)
+        action.triggered.connect(partial(self._set_all_columns_visible, True))
+        menu.addAction(action)
+        action = QtWidgets.QAction('Show None', parent=self)
+        action.triggered.connect(partial(self._set_all_columns_visible, False))
+        menu.addAction(action)
+
         # Stretch
         self.toolbar_layout.addStretch()
 
@@ -250,11 +281,17 @@ class FilterBrowser(Browser):
         self.search_line.textChanged.connect(self._search_text_changed)
         self.toolbar_layout.addWidget(self.search_line)
 
+        # Only filter once typing pauses, every filter pass visits all rows.
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._search)
+
         # Filters
         self.filter_button = QtWidgets.QToolButton()
         self.filter_button.setCheckable(True)
         self.filter_button.setText('Filters')
-        self.filter_button.setIcon(MaterialIcon('filter_list'))
+        self.filter_button.setIcon(get_icon('filter_list'))
         self.filter_button.toggled.connect(self.toggle_filter_list)
         self.toolbar_layout.addWidget(self.filter_button)
 
@@ -338,55 +375,63 @@ class FilterBrowser(Browser):
             self.splitter.setSizes((1, 0))
 
     def _refresh_fields_menu(self) -> None:
+        # NOTE: Actions are only created and removed for changed columns, existing
+        #  actions are updated in place.
         self.fields_button.setVisible(bool(self._columns))
-        if menu := self.fields_button.menu():
-            for action in menu.actions():
+        menu = self.fields_button.menu()
+
+        for i in tuple(self._field_actions):
+            if i >= len(self._columns) or not self._columns[i].enabled:
+                action = self._field_actions.pop(i)
+                self.fields_action_group.removeAction(action)
+                menu.removeAction(action)
                 action.deleteLater()
-        else:
-            menu = QtWidgets.QMenu(parent=self.fields_button)
-            self.fields_button.setMenu(menu)
 
         for i, column in enumerate(self._columns):
-            if column.enabled:
-                action = QtWidgets.QAction(column.field.label, parent=self)
+            if not column.enabled:
+                continue
+            action = self._field_actions.get(i)
+            if action is None:
+                action = QtWidgets.QAction(parent=self)
                 action.setCheckable(True)
-                action.setChecked(column.visible)
-                action.toggled.connect(partial(self._set_column_visible, i))
-                menu.addAction(action)
-
-        menu.addSeparator()
-        action = QtWidgets.QAction('Show All', parent=self)
-        action.triggered.connect(partial(self._set_all_columns_visible, True))
-        menu.addAction(action)
-        action = QtWidgets.QAction('Show None', parent=self)
-        action.triggered.connect(partial(self._set_all_columns_visible, False))
-        menu.addAction(action)
+                action.setData(i)
+                self.fields_action_group.addAction(action)
+                before = self._fields_separator
+                for j in sorted(self._field_actions):
+                    if j > i:
+                        before = self._field_actions[j]
+                        break
+                menu.insertAction(before, action)
+                self._field_actions[i] = action
+            action.setText(column.field.label)
+            action.setChecked(column.visible)
 
     def _refresh_groups_menu(self) -> None:
+        # NOTE: Group actions are reused in order, only the surplus is removed.
         self.groups_button.setVisible(bool(self._groups))
-        if menu := self.groups_button.menu():
-            for action in menu.actions():
-                action.deleteLater()
-        else:
-            menu = QtWidgets.QMenu(parent=self.groups_button)
-            self.groups_button.setMenu(menu)
-
-        action_group = QtWidgets.QActionGroup(self)
-        action = QtWidgets.QAction('None', parent=self)
-        action.setCheckable(True)
-        action_group.addAction(action)
-
-        for group in self._groups:
-            action = QtWidgets.QAction(group.label, parent=self)
-            action.setCheckable(True)
+        menu = self.groups_button.menu()
+
+        actions = self._group_actions
+        for action in actions[len(self._groups) :]:
+            self.groups_action_group.removeAction(action)
+            menu.removeAction(action)
+            action.deleteLater()
+        del actions[len(self._groups) :]
+
+        for i, group in enumerate(self._groups):
+            if i < len(actions):
+                action = actions[i]
+            else:
+                action = QtWidgets.QAction(parent=self)
+                action.setCheckable(True)
+                self.groups_action_group.addAction(action)
+                menu.addAction(action)
+                actions.append(action)
+            action.setText(group.label)
             action.setData(group)
-            action_group.addAction(action)
 
-        for action in action_group.actions():
-            group = action.data()
-            action.setChecked(group == self._group)
-            action.triggered.connect(partial(self._update_group, group))
-            menu.addAction(action)
+        for action in self.groups_action_group.actions():
+            action.setChecked(action.data() == self._group)
 
     def _set_column_visible(self, i: int, visible: bool = True) -> None:
         column = self._columns[i]
@@ -396,11 +441,17 @@ class FilterBrowser(Browser):
             self.tree.resizeColumnToContents(i)
 
     def _set_all_columns_visible(self, visible: bool = True) -> None:
-        for i, column in enumerate(self._columns):
+        for column in self._columns:
             column.visible = visible
-            self.tree.setColumnHidden(i, not column.visible or not column.enabled)
+        self._refresh_columns()
         self._refresh_fields_menu()
 
+    def _field_action_triggered(self, action: QtWidgets.QAction) -> None:
+        self._set_column_visible(action.data(), action.isChecked())
+
+    def _group_action_triggered(self, action: QtWidgets.QAction) -> None:
+        self._update_group(action.data())
+
     def _update_group(self, group: Group | None) -> None:
         self._group = group
         self.model.set_group(group)
@@ -412,8 +463,11 @@ class FilterBrowser(Browser):
                     self.proxy.sort(i, group.order)
                     break
 
+    def _search(self) -> None:
+        self.proxy.setFilterWildcard(self.search_line.text())
+
     def _search_text_changed(self, text: str) -> None:
-        self.proxy.setFilterWildcard(text)
+        self._search_timer.start()
 
     def _splitter_moved(self) -> None:
         try:
@@ -1,7 +1,9 @@
 from __future__ import annotations
 import logging
 import operator
+from collections import deque
 from collections.abc import Container
+from functools import lru_cache, partial
 from typing import Any, Sequence, Optional, Callable
 
 from qtpy import QtCore, QtGui, QtWidgets
@@ -10,8 +12,13 @@ from qt_material_icons import MaterialIcon
 from qt_parameters import CollapsibleBox
 from qt_parameters.scrollarea import VerticalScrollArea
 
+from .icons import get_icon
+
 logger = logging.getLogger(__name__)
 
+# The maximum number of results Filter caches for distinct values.
+MAX_CACHED_RESULTS = 4096
+
 
 def is_in(a: Any, b: Container) -> bool:
     return a in b
@@ -21,12 +28,27 @@ def is_not_in(a: Any, b: Container) -> bool:
     return a not in b
 
 
+def is_empty(value: Any) -> bool:
+    """
+    Returns whether a filter value is unset. Only None and empty builtin
+    containers count, other values like 0 or False are valid filter values.
+    """
+    if value is None:
+        return True
+    if isinstance(value, (str, list, tuple, dict, set, frozenset)):
+        return not value
+    return False
+
+
 class Filter:
     value: Any = None
     match: Optional[Callable] = operator.eq
     role: QtCore.Qt.ItemDataRole = QtCore.Qt.ItemDataRole.DisplayRole
     inverted: bool = False
 
+    _predicate: Optional[Callable[[Any], bool]] = None
+    _results: dict[tuple[type, Any], bool]
+
     def __repr__(self) -> str:
         match = self.match.__name__ if self.match else None
         return (
@@ -36,20 +58,103 @@ class Filter:
             f'role={self.role})'
         )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in ('value', 'match', 'inverted'):
+            self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Rebuilds the predicate and drops the cached results on the next call to
+        accepts. Assigning the value does this already, call it after changing
+        the value in place.
+        """
+        super().__setattr__('_predicate', None)
+
     def accepts(self, value: Any) -> bool:
-        if self.match is None or value is None:
+        if value is None:
             return True
-
-        # Note: Allow values like 0 but not other falsy values.
-        if self.value == 0:
+        if self._predicate is None:
+            self._predicate = self._build_predicate()
+            self._results = {}
+
+        # Columns usually repeat the same values, so results are cached per value.
+        # NOTE: Equal values of different types like 1, 1.0 and True share a hash,
+        #  the type is part of the key so a match can tell them apart.
+        key = (type(value), value)
+        try:
+            return self._results[key]
+        except KeyError:
             pass
-        elif not self.value:
-            return True
-        return self.match(value, self.value) != self.inverted
+        except TypeError:
+            return self._predicate(value)
+
+        result = self._predicate(value)
+        if len(self._results) < MAX_CACHED_RESULTS:
+            self._results[key] = result
+        return result
+
+    def _build_predicate(self) -> Callable[[Any], bool]:
+        """
+        Returns a function that checks a single value against the filter. It is
+        specialized for the current match, value and inversion so that checking
+        each cell doesn't need to look them up again.
+        """
+        match = self.match
+        filter_value = self.value
+        inverted = self.inverted
+
+        # NOTE: The value is never evaluated for truthiness directly, that is
+        #  ambiguous or raises for types like numpy arrays.
+        if match is None or is_empty(filter_value):
+            return lambda value: True
+
+        if match in (is_in, is_not_in) and isinstance(filter_value, (tuple, list, set)):
+            # Membership in a frozenset is a hash lookup instead of a scan.
+            try:
+                values = frozenset(filter_value)
+            except TypeError:
+                # Values with unhashable members can only be scanned.
+                return lambda value: match(value, filter_value) != inverted
+            if match is is_not_in:
+                inverted = not inverted
+
+            def predicate(value: Any) -> bool:
+                try:
+                    return (value in values) != inverted
+                except TypeError:
+                    # Unhashable values can only be compared by equality.
+                    return (value in filter_value) != inverted
+
+            return predicate
+
+        if match is operator.eq:
+            # Enum members and interned strings usually match by identity already.
+            return (
+                lambda value: (value is filter_value or value == filter_value)
+                != inverted
+            )
+
+        return lambda value: match(value, filter_value) != inverted
+
+
+@lru_cache(maxsize=4)
+def get_invert_icon(on_rgba: int, off_rgba: int) -> MaterialIcon:
+    """
+    Return a shared invert icon for the given colors. The colors are part of the
+    key so a palette change results in a new icon.
+    """
+    icon = MaterialIcon('block')
+    on_color = QtGui.QColor.fromRgba(on_rgba)
+    icon.set_color(on_color, QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
+    off_color = QtGui.QColor.fromRgba(off_rgba)
+    icon.set_color(off_color, QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+    return icon
 
 
 class FilterWidget(CollapsibleBox):
     filter_changed: QtCore.Signal = QtCore.Signal(Filter)
+    collapsed_changed: QtCore.Signal = QtCore.Signal(bool)
 
     def __init__(
         self, title: str = '', parent: QtWidgets.QWidget | None = None
@@ -60,6 +165,12 @@ class FilterWidget(CollapsibleBox):
         self._default: Any = None
         self._values: tuple = ()
 
+        # Coalesce multiple changes into a single filter_changed signal.
+        self._filter_changed_timer = QtCore.QTimer(self)
+        self._filter_changed_timer.setSingleShot(True)
+        self._filter_changed_timer.setInterval(75)
+        self._filter_changed_timer.timeout.connect(self._emit_filter_changed)
+
     def _init_ui(self) -> None:
         super()._init_ui()
 
@@ -71,16 +182,14 @@ class FilterWidget(CollapsibleBox):
         header_layout = self.header.layout()
         header_layout.setSpacing(0)
 
-        invert_icon = MaterialIcon('block')
         palette = QtWidgets.QApplication.palette()
-        color = palette.color(
+        on_color = palette.color(
             QtGui.QPalette.ColorGroup.Normal, QtGui.QPalette.ColorRole.WindowText
         )
-        invert_icon.set_color(color, QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.On)
-        color = palette.color(
+        off_color = palette.color(
             QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.WindowText
         )
-        invert_icon.set_color(color, QtGui.QIcon.Mode.Normal, QtGui.QIcon.State.Off)
+        invert_icon = get_invert_icon(on_color.rgba(), off_color.rgba())
 
         self.invert_button = QtWidgets.QToolButton()
         self.invert_button.setIcon(invert_icon)
@@ -91,19 +200,25 @@ class FilterWidget(CollapsibleBox):
         header_layout.insertWidget(header_layout.count() - 1, self.invert_button)
 
         self.reset_button = QtWidgets.QToolButton()
-        self.reset_button.setIcon(MaterialIcon('undo'))
+        self.reset_button.setIcon(get_icon('undo'))
         self.reset_button.setAutoRaise(True)
         self.reset_button.setFocusPolicy(QtCore.Qt.FocusPolicy.NoFocus)
         self.reset_button.setEnabled(False)
         self.reset_button.clicked.connect(self.reset)
         header_layout.insertWidget(header_layout.count() - 1, self.reset_button)
 
+    def set_collapsed(self, collapsed: bool) -> None:
+        changed = collapsed != self.collapsed()
+        super().set_collapsed(collapsed)
+        if changed and collapsed == self.collapsed():
+            self.collapsed_changed.emit(collapsed)
+
     def filter(self) -> Filter:
         return self._filter
 
     def set_filter(self, value: Filter) -> None:
         self._filter = value
-        self.filter_changed.emit(self._filter)
+        self._filter_changed_timer.start()
 
     def inverted(self) -> bool:
         return self._filter.inverted
@@ -111,28 +226,44 @@ class FilterWidget(CollapsibleBox):
     def set_inverted(self, inverted: bool) -> None:
         if self._filter.inverted != inverted:
             self._filter.inverted = inverted
-            self.filter_changed.emit(self._filter)
+            self._filter_changed_timer.start()
 
     def value(self) -> Any:
         return self._filter.value
 
     def set_value(self, value: Any) -> None:
-        if self._filter.value != value:
+        if value is self._filter.value:
+            # NOTE: The same object may have been changed in place, the filter
+            #  would keep the results of the previous content.
+            self._filter.invalidate()
+        elif self._filter.value != value:
             self._filter.value = value
-            self.filter_changed.emit(self._filter)
+            self._filter_changed_timer.start()
             self._refresh()
 
     def values(self) -> tuple:
         return self._values
 
-    def set_values(self, values: Sequence) -> None:
-        values = tuple(value for value in values if value is not None)
+    def set_values(self, values: Sequence | set) -> None:
+        if isinstance(values, (set, frozenset)):
+            values = tuple(values - {None})
+        else:
+            values = tuple(value for value in values if value is not None)
         self._values = values
 
+    def flush(self) -> None:
+        """Emits a pending filter_changed signal immediately."""
+        if self._filter_changed_timer.isActive():
+            self._filter_changed_timer.stop()
+            self._emit_filter_changed()
+
     def reset(self) -> None:
         self.set_value(self._default)
         self.set_inverted(False)
 
+    def _emit_filter_changed(self) -> None:
+        self.filter_changed.emit(self._filter)
+
     def _refresh(self) -> None:
         has_changes = self._filter.value != self._default
         if has_changes:
@@ -156,43 +287,84 @@ class MultiFilterWidget(FilterWidget):
         self._default: tuple = ()
         self._checkboxes: tuple[QtWidgets.QCheckBox, ...] = ()
 
+        # The id of each checkbox is the index of its value.
+        self._button_group = QtWidgets.QButtonGroup(self)
+        self._button_group.setExclusive(False)
+        self._button_group.idToggled.connect(self._checkbox_toggled)
+
     def set_value(self, value: Sequence) -> None:
+        # The order of the values doesn't change what the filter accepts.
+        values = frozenset(value or ())
+        if values == frozenset(self._filter.value or ()):
+            return
         super().set_value(value)
 
+        # NOTE: The button group emits idToggled, blocking the checkboxes' signals
+        #  does not prevent it.
+        self._button_group.blockSignals(True)
         for checkbox, v in zip(self._checkboxes, self._values):
-            checkbox.blockSignals(False)
-            checkbox.setChecked(v in value)
-            checkbox.blockSignals(False)
+            checkbox.setChecked(v in values)
+        self._button_group.blockSignals(False)
 
-    def set_values(self, values: Sequence) -> None:
+    def set_values(self, values: Sequence | set) -> None:
+        previous_values = self._values
         super().set_values(values)
-        self._update_checkboxes()
-
-    def _checkbox_toggled(self) -> None:
-        values = []
-        for checkbox, value in zip(self._checkboxes, self._values):
-            if checkbox.isChecked():
-                values.append(value)
+        if self._values != previous_values:
+            self._update_checkboxes()
+
+    def _checkbox_toggled(self, id_: int, checked: bool) -> None:
+        # Only add or remove the toggled value instead of checking all checkboxes.
+        value = self._values[id_]
+        # NOTE: Selected values without a checkbox can't be unchecked anymore, they
+        #  are dropped from the filter.
+        current = set(self._values)
+        values = dict.fromkeys(v for v in self._filter.value or () if v in current)
+        if checked:
+            values[value] = None
+        else:
+            values.pop(value, None)
         super().set_value(tuple(values))
 
-    def _clear_layout(self) -> None:
-        while item := self.layout().takeAt(0):
-            if widget := item.widget():
-                widget.deleteLater()
-
     def _update_checkboxes(self) -> None:
-        self._clear_layout()
-        checkboxes = []
-        for value in self._values:
-            checkbox = QtWidgets.QCheckBox()
+        # NOTE: Existing checkboxes are relabeled, only the difference in count is
+        #  created or deleted.
+        self.setUpdatesEnabled(False)
+        layout = self.layout()
+        # Disable the layout so it is only recalculated once after all changes.
+        layout.setEnabled(False)
+        count = len(self._values)
+        checkboxes = list(self._checkboxes)
+        new_checkboxes = []
+        self._button_group.blockSignals(True)
+
+        for checkbox in checkboxes[count:]:
+            self._button_group.removeButton(checkbox)
+            layout.removeWidget(checkbox)
+            checkbox.deleteLater()
+        del checkboxes[count:]
+
+        for i, value in enumerate(self._values):
+            if i < len(checkboxes):
+                checkbox = checkboxes[i]
+            else:
+                checkbox = QtWidgets.QCheckBox()
+                self._button_group.addButton(checkbox, i)
+                checkboxes.append(checkbox)
+                new_checkboxes.append(checkbox)
             checkbox.setText(str(value))
-            if self._filter.value:
-                checkbox.setChecked(self._filter.accepts(value))
-            checkbox.toggled.connect(self._checkbox_toggled)
-            checkboxes.append(checkbox)
-            self.layout().addWidget(checkbox)
+            checkbox.setChecked(
+                bool(self._filter.value) and self._filter.accepts(value)
+            )
+        self._button_group.blockSignals(False)
+
+        for checkbox in new_checkboxes:
+            layout.addWidget(checkbox)
         self._checkboxes = tuple(checkboxes)
 
+        layout.setEnabled(True)
+        self.setUpdatesEnabled(True)
+        layout.activate()
+
 
 class FilterListWidget(VerticalScrollArea):
     filter_changed: QtCore.Signal = QtCore.Signal(Filter)
@@ -202,6 +374,10 @@ class FilterListWidget(VerticalScrollArea):
 
         self._model: QtGui.QStandardItemModel | None = None
         self._widgets: dict[int, FilterWidget] = {}
+        self._columns_by_widget: dict[FilterWidget, int] = {}
+        self._values_cache: dict[tuple[int, int], set] = {}
+        # Columns whose values were skipped while their widget was collapsed.
+        self._stale_columns: set[int] = set()
 
         self._init_ui()
 
@@ -219,22 +395,40 @@ class FilterListWidget(VerticalScrollArea):
         return size_hint
 
     def add_filter_widget(self, column: int, widget: FilterWidget) -> None:
-        index = self._layout.count() - 1
-        self._layout.insertWidget(index, widget)
-        widget.filter_changed.connect(self.filter_changed.emit)
-        self._widgets[column] = widget
-        self.refresh_column(column)
+        self.add_filter_widgets({column: widget})
+
+    def add_filter_widgets(self, widgets: dict[int, FilterWidget]) -> None:
+        """Adds multiple filter widgets with a single layout pass."""
+        container = self.widget()
+        container.setUpdatesEnabled(False)
+        self._layout.setEnabled(False)
+        try:
+            for column, widget in widgets.items():
+                index = self._layout.count() - 1
+                self._layout.insertWidget(index, widget)
+                widget.filter_changed.connect(self.filter_changed.emit)
+                widget.collapsed_changed.connect(
+                    partial(self._filter_widget_collapsed_changed, widget)
+                )
+                self._widgets[column] = widget
+                self._columns_by_widget[widget] = column
+        finally:
+            self._layout.setEnabled(True)
+            container.setUpdatesEnabled(True)
+        self._layout.activate()
+
+        for column in widgets:
+            self.refresh_column(column)
 
     def remove_filter_widget(
         self, column: int = -1, widget: FilterWidget | None = None
     ) -> None:
-        if column < 0:
-            for c, w in self._widgets.items():
-                if w == widget:
-                    column = c
-                    break
-        widget = self._widgets.get(column)
+        if column < 0 and widget is not None:
+            column = self._columns_by_widget.get(widget, -1)
+        widget = self._widgets.pop(column, None)
         if widget:
+            self._columns_by_widget.pop(widget, None)
+            self._stale_columns.discard(column)
             self._layout.removeWidget(widget)
             widget.deleteLater()
 
@@ -248,7 +442,18 @@ class FilterListWidget(VerticalScrollArea):
         return self._model
 
     def set_model(self, model: QtGui.QStandardItemModel) -> None:
+        if self._model is not None:
+            self._model.dataChanged.disconnect(self._model_data_changed)
+            for signal in self._model_structure_signals(self._model):
+                signal.disconnect(self._clear_values_cache)
+
         self._model = model
+        self._values_cache.clear()
+
+        if model is not None:
+            model.dataChanged.connect(self._model_data_changed)
+            for signal in self._model_structure_signals(model):
+                signal.connect(self._clear_values_cache)
         self.refresh()
 
     def refresh(self) -> None:
@@ -261,29 +466,114 @@ class FilterListWidget(VerticalScrollArea):
             return
 
         enabled = column < self._model.columnCount()
-        if enabled:
-            filter_role = widget.filter().role
-            values = self._get_column_values(column, filter_role)
-            widget.set_values(tuple(values))
-
         widget.setEnabled(enabled)
         widget.setVisible(enabled)
 
+        if enabled and widget.collapsed():
+            # NOTE: Collapsed widgets don't show their values, they are collected
+            #  once the widget is expanded.
+            self._stale_columns.add(column)
+        elif enabled:
+            self._stale_columns.discard(column)
+            filter_role = widget.filter().role
+            key = (column, int(filter_role))
+            values = self._values_cache.get(key)
+            if values is None:
+                values = self._get_column_values(column, filter_role)
+                self._values_cache[key] = values
+            widget.set_values(values)
+
     def _get_column_values(
         self,
         column: int,
         role: QtCore.Qt.ItemDataRole = QtCore.Qt.ItemDataRole.DisplayRole,
         parent: QtCore.QModelIndex | None = None,
-    ) -> tuple:
+    ) -> set:
         """Returns all values of a column for a given role recursively."""
-        values = set()
+        model = self._model
         if parent is None:
             parent = QtCore.QModelIndex()
+        if isinstance(model, QtGui.QStandardItemModel):
+            return self._get_item_values(column, role, parent)
 
-        for row in range(self._model.rowCount(parent)):
-            index = self._model.index(row, column, parent)
-            value = index.data(role)
-            values.add(value)
-            sibling_index = index.siblingAtColumn(0)
-            values.update(self._get_column_values(column, role, sibling_index))
-        return tuple(values)
+        values = set()
+        # NOTE: Walk the tree with a stack instead of recursion, children are only
+        #  visited for rows that have any.
+        parents = deque((parent,))
+        while parents:
+            parent = parents.pop()
+            for row in range(model.rowCount(parent)):
+                values.add(model.index(row, column, parent).data(role))
+                index = model.index(row, 0, parent)
+                if model.hasChildren(index):
+                    parents.append(index)
+        return values
+
+    def _get_item_values(
+        self,
+        column: int,
+        role: QtCore.Qt.ItemDataRole,
+        parent: QtCore.QModelIndex,
+    ) -> set:
+        """
+        Returns all values of a column for a given role recursively by reading the
+        items of a QStandardItemModel directly.
+        """
+        # NOTE: Going through the items skips creating a QModelIndex per cell,
+        #  which is about twice as fast as the generic traversal.
+        model = self._model
+        if parent.isValid():
+            parent_item = model.itemFromIndex(parent)
+        else:
+            parent_item = model.invisibleRootItem()
+
+        values = set()
+        add = values.add
+        parents = deque((parent_item,))
+        while parents:
+            parent_item = parents.pop()
+            for row in range(parent_item.rowCount()):
+                item = parent_item.child(row, column)
+                add(item.data(role) if item is not None else None)
+                if column:
+                    item = parent_item.child(row, 0)
+                if item is not None and item.hasChildren():
+                    parents.append(item)
+        return values
+
+    def _filter_widget_collapsed_changed(
+        self, widget: FilterWidget, collapsed: bool
+    ) -> None:
+        column = self._columns_by_widget.get(widget)
+        if not collapsed and column in self._stale_columns:
+            self.refresh_column(column)
+
+    def _clear_values_cache(self, *args) -> None:
+        self._values_cache.clear()
+
+    def _model_data_changed(
+        self,
+        top_left: QtCore.QModelIndex,
+        bottom_right: QtCore.QModelIndex,
+        roles: Sequence[int] = (),
+    ) -> None:
+        # Only invalidate the cached values of the changed columns and roles.
+        columns = range(top_left.column(), bottom_right.column() + 1)
+        for key in tuple(self._values_cache):
+            column, role = key
+            if column in columns and (not roles or role in roles):
+                del self._values_cache[key]
+
+    @staticmethod
+    def _model_structure_signals(
+        model: QtCore.QAbstractItemModel,
+    ) -> tuple[QtCore.Signal, ...]:
+        return (
+            model.modelReset,
+            model.rowsInserted,
+            model.rowsRemoved,
+            model.rowsMoved,
+            model.columnsInserted,
+            model.columnsRemoved,
+            model.columnsMoved,
+        )
@@ -0,0 +1,20 @@
+from functools import lru_cache
+
+from qt_material_icons import MaterialIcon
+from qtpy import QtWidgets
+
+
+def get_icon(name: str, size: int = 20) -> MaterialIcon:
+    """
+    Return a shared MaterialIcon so each icon is only loaded once. QIcons are
+    implicitly shared, the returned icon should not be modified.
+    """
+    # NOTE: The icon is colored with the palette when it is created, the palette
+    #  is part of the key so a palette change results in a new icon.
+    palette_key = QtWidgets.QApplication.palette().cacheKey()
+    return _get_icon(name, size, palette_key)
+
+
+@lru_cache(maxsize=128)
+def _get_icon(name: str, size: int, palette_key: int) -> MaterialIcon:
+    return MaterialIcon(name, size=size)
@@ -3,10 +3,12 @@ from __future__ import annotations
 import dataclasses
 import enum
 import logging
+import operator
+from collections import defaultdict
 from collections.abc import Sequence
-from functools import cache
+from functools import cache, partial
 from types import SimpleNamespace
-from typing import Any
+from typing import Any, Callable
 
 from qt_material_icons import MaterialIcon
 from qtpy import QtWidgets, QtGui, QtCore
@@ -19,9 +21,31 @@ CheckState = QtCore.Qt.CheckState
 ItemDataRole = QtCore.Qt.ItemDataRole
 ItemFlag = QtCore.Qt.ItemFlag
 
+# NOTE: Bound once at module level, looking up enum members on the class is
+#  comparatively slow in the per-cell code paths.
+DISPLAY_ROLE = ItemDataRole.DisplayRole
+EDIT_ROLE = ItemDataRole.EditRole
+DECORATION_ROLE = ItemDataRole.DecorationRole
+USER_ROLE = ItemDataRole.UserRole
+CHECKED = CheckState.Checked
+UNCHECKED = CheckState.Unchecked
+
 logger = logging.getLogger(__name__)
 
 ATTRIBUTE_SEPARATOR = '.'
+ITEM_FLAGS = ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable
+
+
+def _identity(obj: Any) -> Any:
+    return obj
+
+
+@cache
+def _compiled_getter(name: str) -> Callable[[Any], Any]:
+    """Return a getter for the attribute name, dotted names are resolved in C."""
+    if name:
+        return operator.attrgetter(name)
+    return _identity
 
 
 def get_value(obj: Any, name: str) -> Any:
@@ -29,25 +53,30 @@ def get_value(obj: Any, name: str) -> Any:
     Return the value from an object's attribute. Attribute name can be separated by
     a dot.
     """
-    attributes = name.split(ATTRIBUTE_SEPARATOR) if name else ()
-    value = obj
-    for attribute in attributes:
-        value = getattr(value, attribute, None)
-    return value
+    try:
+        return _compiled_getter(name)(obj)
+    except AttributeError:
+        return None
 
 
 def set_value(obj: Any, name: str, value: Any) -> None:
     """
     Set the attribute on an object, creating an object structure if needed.
     """
-    attributes = name.split(ATTRIBUTE_SEPARATOR)
-    for attribute in attributes[:-1]:
-        obj = getattr(obj, attribute, None)
-        if obj is None:
-            namespace = SimpleNamespace()
-            setattr(obj, attribute, namespace)
-            obj = namespace
-    setattr(obj, attributes[-1], value)
+    path, _, attribute = name.rpartition(ATTRIBUTE_SEPARATOR)
+    if path:
+        # Most of the time the structure already exists.
+        parent = get_value(obj, path)
+        if parent is None:
+            parent = obj
+            for parent_attribute in path.split(ATTRIBUTE_SEPARATOR):
+                child = getattr(parent, parent_attribute, None)
+                if child is None:
+                    child = SimpleNamespace()
+                    setattr(parent, parent_attribute, child)
+                parent = child
+        obj = parent
+    setattr(obj, attribute, value)
 
 
 @dataclasses.dataclass
@@ -61,67 +90,89 @@ class Field:
         if not self.label:
             self.label = utils.title(self.name)
 
-    def create_item(self, value: Any) -> QtGui.QStandardItem:
-        item = QtGui.QStandardItem()
-        flags = ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable
+        # The flags are the same for every item of the field.
+        flags = ITEM_FLAGS
         if self.editable:
             flags |= ItemFlag.ItemIsEditable
         if self.checkable:
             flags |= ItemFlag.ItemIsUserCheckable
-            item.setCheckState(CheckState.Unchecked)
-        item.setFlags(flags)
-        item.setData(value, ItemDataRole.DisplayRole)
+        self._flags = flags
+        self._getter = _compiled_getter(self.name)
+
+    def get_value(self, obj: Any) -> Any:
+        """Return the value of the field from an object."""
+        try:
+            return self._getter(obj)
+        except AttributeError:
+            return None
+
+    def create_item(self, value: Any) -> QtGui.QStandardItem:
+        item = QtGui.QStandardItem()
+        item.setFlags(self._flags)
+        if self.checkable:
+            item.setCheckState(UNCHECKED)
+        item.setData(value, DISPLAY_ROLE)
         return item
 
     def refresh(self, value: Any, index: QtCore.QModelIndex) -> None:
-        index.model().setData(index, value, ItemDataRole.DisplayRole)
+        if index.data(DISPLAY_ROLE) != value:
+            index.model().setData(index, value, DISPLAY_ROLE)
 
 
 class BoolField(Field):
     def create_item(self, value: bool) -> QtGui.QStandardItem:
         item = QtGui.QStandardItem()
-        item.setFlags(ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable)
-        if self.editable:
-            item.setFlags(item.flags() or ItemFlag.ItemIsUserCheckable)
-        item.setCheckState(CheckState.Checked if value else CheckState.Unchecked)
-        item.setData(value, ItemDataRole.UserRole)
+        item.setFlags(ITEM_FLAGS)
+        item.setCheckState(CHECKED if value else UNCHECKED)
+        item.setData(value, USER_ROLE)
         return item
 
     def refresh(self, value: bool, index: QtCore.QModelIndex) -> None:
+        if index.data(USER_ROLE) == value:
+            return
         model = index.model()
         if isinstance(model, QtGui.QStandardItemModel):
             item = model.itemFromIndex(index)
-            item.setCheckState(CheckState.Checked if value else CheckState.Unchecked)
-        index.model().setData(index, value, ItemDataRole.UserRole)
+            item.setCheckState(CHECKED if value else UNCHECKED)
+        index.model().setData(index, value, USER_ROLE)
 
 
 class EnumField(Field):
     def create_item(self, value: enum.Enum | None) -> QtGui.QStandardItem:
         item = QtGui.QStandardItem()
-        item.setFlags(ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable)
+        item.setFlags(ITEM_FLAGS)
         if isinstance(value, enum.Enum):
-            item.setData(value.value, ItemDataRole.DisplayRole)
+            item.setData(value.value, DISPLAY_ROLE)
         return item
 
     def refresh(self, value: enum.Enum | None, index: QtCore.QModelIndex) -> None:
         value = value.value if isinstance(value, enum.Enum) else None
-        index.model().setData(index, value.value, ItemDataRole.DisplayRole)
+        if index.data(DISPLAY_ROLE) != value:
+            index.model().setData(index, value, DISPLAY_ROLE)
 
 
 @dataclasses.dataclass
 class ImageField(Field):
     def create_item(self, value: str) -> QtGui.QStandardItem:
         item = QtGui.QStandardItem()
-        item.setFlags(ItemFlag.ItemIsEnabled | ItemFlag.ItemIsSelectable)
+        item.setFlags(ITEM_FLAGS)
         if not value:
             value = get_default_thumbnail()
-        item.setData(value, ItemDataRole.DecorationRole)
+        item.setData(value, DECORATION_ROLE)
         return item
 
     def refresh(self, value: str, index: QtCore.QModelIndex) -> None:
         if not value:
             value = get_default_thumbnail()
-        index.model().setData(index, value, ItemDataRole.DecorationRole)
+        current = index.data(DECORATION_ROLE)
+        # NOTE: Pixmaps can't be compared by the model, setting the same pixmap
+        #  would still emit dataChanged.
+        if isinstance(value, QtGui.QPixmap) and isinstance(current, QtGui.QPixmap):
+            if current.cacheKey() == value.cacheKey():
+                return
+        elif current == value:
+            return
+        index.model().setData(index, value, DECORATION_ROLE)
 
 
 @dataclasses.dataclass
@@ -138,11 +189,34 @@ class Group:
 
 
 class Container:
+    """
+    Element that holds a group of elements. It only provides the value of the
+    attribute the elements are grouped by.
+    """
+
+    __slots__ = ('_name', '_value')
+
     def __init__(self, elements: Sequence, name: str) -> None:
-        if elements:
-            element = elements[0]
-            value = get_value(element, name)
-            set_value(self, name, value)
+        self._name = name
+        self._value = get_value(elements[0], name) if elements else None
+
+    def __getattr__(self, attribute: str) -> Any:
+        # NOTE: Only called for attributes that aren't slots. Dotted names are
+        #  resolved one attribute at a time, each step returns a container for the
+        #  rest of the name.
+        # Unset slots and special names are looked up on copies and unpickled
+        # instances before the slots are set, reading the name would recurse.
+        if attribute in Container.__slots__ or attribute.startswith('__'):
+            raise AttributeError(attribute)
+        head, _, path = self._name.partition(ATTRIBUTE_SEPARATOR)
+        if attribute != head:
+            raise AttributeError(attribute)
+        if not path:
+            return self._value
+        container = Container.__new__(Container)
+        container._name = path
+        container._value = self._value
+        return container
 
 
 class ElementModel(QtGui.QStandardItemModel):
@@ -150,7 +224,14 @@ class ElementModel(QtGui.QStandardItemModel):
         super().__init__(parent)
 
         self._group = None
-        self._fields: list[Field] = []
+        # NOTE: The fields are only replaced when a field is added or removed, so
+        #  the tuple can be handed out and iterated without copying it.
+        self._fields: tuple[Field, ...] = ()
+        # Maps the id of each element to its row for constant time lookups.
+        self._indexes: dict[int, QtCore.QPersistentModelIndex] = {}
+        self._header_labels: tuple[str, ...] = ()
+
+        self.rowsAboutToBeRemoved.connect(self._rows_about_to_be_removed)
 
     def group(self) -> Group | None:
         return self._group
@@ -167,69 +248,97 @@ class ElementModel(QtGui.QStandardItemModel):
 
         elements = [e for e in self.elements() if not isinstance(e, Container)]
 
-        self.clear()
+        # NOTE: Attached proxies would sort and filter every inserted row while the
+        #  model is reset, the rows are rebuilt silently between the reset calls.
+        #  Clearing the model would start a reset of its own, only the rows are
+        #  removed.
+        self.beginResetModel()
+        self.blockSignals(True)
+        try:
+            self._indexes.clear()
+            self.removeRows(0, self.rowCount())
+            self._append_groups(elements, group)
+        finally:
+            self.blockSignals(False)
+        self.endResetModel()
+        # NOTE: Resetting the model invalidates all persistent indexes, the index
+        #  map can only be filled once the reset is done.
+        self._register_item(self.invisibleRootItem())
+
+    def _append_groups(self, elements: list, group: Group | None) -> None:
         if group is None:
-            for element in elements:
-                self.append_element(element)
+            self.append_elements(elements)
             return
 
-        stacks = {}
+        stacks = defaultdict(list)
+        getter = _compiled_getter(group.name)
         for element in elements:
-            value = get_value(element, group.name)
-            stack = stacks.get(value, [])
-            stack.append(element)
-            stacks[value] = stack
-
+            try:
+                value = getter(element)
+            except AttributeError:
+                value = None
+            stacks[value].append(element)
+
+        reverse = group.order == QtCore.Qt.SortOrder.AscendingOrder
+        sort = partial(get_value, name=group.sort)
         for stack in stacks.values():
-            if not stack:
-                continue
-            reverse = group.order == QtCore.Qt.SortOrder.AscendingOrder
-            stack.sort(key=lambda obj: get_value(obj, group.sort), reverse=reverse)
+            stack.sort(key=sort, reverse=reverse)
             if group.container:
                 container = Container(stack, group.name)
                 parent_index = self.append_element(container)
-                for element in stack:
-                    self.append_element(element, parent_index)
+                self.append_elements(stack, parent_index)
             else:
                 parent_index = self.append_element(stack[-1])
-                for element in stack[:-1]:
-                    self.append_element(element, parent_index)
+                self.append_elements(stack[:-1], parent_index)
 
     def clear(self) -> None:
+        self._indexes.clear()
+        self._header_labels = ()
         super().clear()
         # NOTE: Clearing the model also clears the headers.
         self.refresh_header()
 
     def fields(self) -> tuple[Field, ...]:
-        return tuple(self._fields)
+        return self._fields
 
     def add_field(self, field: Field) -> None:
-        self._fields.append(field)
+        self._fields = (*self._fields, field)
         self.refresh_header()
 
     def remove_field(self, field: Field) -> None:
         if field in self._fields:
             column = self._fields.index(field)
             self.removeColumn(column)
-            self._fields.remove(field)
+            self._fields = self._fields[:column] + self._fields[column + 1 :]
             self.refresh_header()
 
     def element(self, index: QtCore.QModelIndex) -> Any:
-        data = self.data(index.siblingAtColumn(0), ItemDataRole.UserRole)
+        data = self.data(index.siblingAtColumn(0), USER_ROLE)
         return data
 
     def elements(self, parent: QtCore.QModelIndex | None = None) -> list:
-        if parent is None:
-            parent = QtCore.QModelIndex()
+        if parent is not None and parent.isValid():
+            parent_item = self.itemFromIndex(parent)
+        else:
+            parent_item = self.invisibleRootItem()
+
+        # NOTE: Walk the items with a stack instead of recursion. Children are
+        #  pushed in reverse so elements are returned parents first, in row order.
         elements = []
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, 0, parent)
-            if not index.isValid():  # optimization
+        role = USER_ROLE
+        items = [parent_item.child(row) for row in range(parent_item.rowCount())]
+        items.reverse()
+        while items:
+            item = items.pop()
+            if item is None:
                 continue
-            data = index.data(ItemDataRole.UserRole)
+            data = item.data(role)
             if data is not None:
                 elements.append(data)
-            elements.extend(self.elements(index))
+            if item.hasChildren():
+                items.extend(
+                    item.child(row) for row in reversed(range(item.rowCount()))
+                )
         return elements
 
     def append_element(
@@ -242,55 +351,151 @@ class ElementModel(QtGui.QStandardItemModel):
         if parent_item is None:
             parent_item = self.invisibleRootItem()
 
-        items = []
-        for field in self._fields:
-            value = get_value(obj, field.name)
-            item = field.create_item(value)
-            items.append(item)
-
+        items = self._create_items(obj)
         if not items:
             return QtCore.QModelIndex()
 
-        item = items[0]
-        item.setData(obj, ItemDataRole.UserRole)
         parent_item.appendRow(items)
-        return item.index()
+        index = items[0].index()
+        self._indexes[id(obj)] = QtCore.QPersistentModelIndex(index)
+        return index
+
+    def append_elements(
+        self,
+        objs: Sequence,
+        parent: QtCore.QModelIndex | None = None,
+    ) -> None:
+        """
+        Append multiple elements with a single rowsInserted signal instead of one
+        for each row.
+        """
+        parent_item = self.itemFromIndex(parent) if parent else None
+        if parent_item is None:
+            parent_item = self.invisibleRootItem()
+
+        if not objs or not self._fields:
+            return
+        rows = [self._create_items(obj) for obj in objs]
+
+        first = parent_item.rowCount()
+        self.beginInsertRows(parent_item.index(), first, first + len(rows) - 1)
+        # NOTE: The rows are appended at the end, the signals of the single inserts
+        #  are blocked and covered by the surrounding begin and end calls.
+        blocked = self.blockSignals(True)
+        try:
+            for items in rows:
+                parent_item.appendRow(items)
+        finally:
+            self.blockSignals(blocked)
+        self.endInsertRows()
+
+        indexes = self._indexes
+        for obj, items in zip(objs, rows):
+            indexes[id(obj)] = QtCore.QPersistentModelIndex(items[0].index())
+
+    def _create_items(self, obj: Any) -> list[QtGui.QStandardItem]:
+        items = [field.create_item(field.get_value(obj)) for field in self._fields]
+        if items:
+            items[0].setData(obj, USER_ROLE)
+        return items
 
     def remove_element(self, element: Any) -> None:
         index = self.find_index(element)
-        if not index:
+        if not index.isValid():
             return
 
-        # Re-parent child rows
         item = self.itemFromIndex(index)
-        parent = item.parent()
-        for row in range(item.rowCount()):
-            items = [item.child(row, column) for column in range(item.columnCount())]
-            parent.appendRow(items)
+        parent_item = item.parent() or self.invisibleRootItem()
+        row = index.row()
 
-        self.removeRow(index.row())
-        if self._group:
-            self.set_group(self._group)
+        # Re-parent child rows
+        children = [item.takeRow(0) for _ in range(item.rowCount())]
+        parent_item.removeRow(row)
+
+        if children:
+            if self._group and not self._group.container:
+                # NOTE: Without containers the last element of a group holds the
+                #  other elements, the last child takes its place.
+                head = children[-1]
+                parent_item.insertRow(row, head)
+                for items in children[:-1]:
+                    head[0].appendRow(items)
+            else:
+                for offset, items in enumerate(children):
+                    parent_item.insertRow(row + offset, items)
+            for items in children:
+                self._register_item(items[0])
+        elif parent_item is not self.invisibleRootItem():
+            # Remove containers that no longer hold any elements.
+            container = parent_item.data(USER_ROLE)
+            if isinstance(container, Container) and not parent_item.hasChildren():
+                self.removeRow(parent_item.row(), parent_item.index().parent())
 
     def find_index(
         self,
         value: Any,
-        role: ItemDataRole = ItemDataRole.UserRole,
+        role: ItemDataRole = USER_ROLE,
         parent: QtCore.QModelIndex | None = None,
     ) -> QtCore.QModelIndex:
         if parent is None:
+            if role == USER_ROLE:
+                persistent_index = self._indexes.get(id(value))
+                if persistent_index is not None and persistent_index.isValid():
+                    index = QtCore.QModelIndex(persistent_index)
+                    if self.data(index, role) is value:
+                        return index
             parent = QtCore.QModelIndex()
-        index = QtCore.QModelIndex()
-        for row in range(self.rowCount(parent)):
-            index = self.index(row, 0, parent)
-            if not index.isValid():
+
+        # NOTE: Qt's match converts between strings and numbers and compares other
+        #  Python objects by identity, so the rows are compared in Python. The
+        #  items are walked directly instead of creating an index for every row,
+        #  in the same order as a recursive search.
+        parent_item = self.itemFromIndex(parent) or self.invisibleRootItem()
+        rows = [(parent_item, row) for row in reversed(range(parent_item.rowCount()))]
+        while rows:
+            parent_item, row = rows.pop()
+            item = parent_item.child(row)
+            if item is None:
+                # Empty cells have no data.
+                if value == None:  # noqa
+                    return self.index(row, 0, parent_item.index())
                 continue
-            if value == self.data(index, role):
-                break
-            index = self.find_index(value, role, index)
-            if index.isValid():
-                break
-        return index
+            if value == item.data(role):
+                return item.index()
+            if count := item.rowCount():
+                rows.extend((item, row) for row in reversed(range(count)))
+        return QtCore.QModelIndex()
+
+    def _register_item(self, item: QtGui.QStandardItem) -> None:
+        """Add the elements of the item and its children to the index map."""
+        items = [item]
+        while items:
+            item = items.pop()
+            if item is None:
+                continue
+            element = item.data(USER_ROLE)
+            if element is not None:
+                index = QtCore.QPersistentModelIndex(item.index())
+                self._indexes[id(element)] = index
+            items.extend(item.child(row) for row in range(item.rowCount()))
+
+    def _rows_about_to_be_removed(
+        self, parent: QtCore.QModelIndex, first: int, last: int
+    ) -> None:
+        if not self._indexes:
+            return
+        if parent.isValid():
+            parent_item = self.itemFromIndex(parent)
+        else:
+            parent_item = self.invisibleRootItem()
+
+        items = [parent_item.child(row) for row in range(first, last + 1)]
+        while items:
+            item = items.pop()
+            if item is None:
+                continue
+            self._indexes.pop(id(item.data(USER_ROLE)), None)
+            items.extend(item.child(row) for row in range(item.rowCount()))
 
     def refresh_index(self, index: QtCore.QModelIndex) -> None:
         """
@@ -299,7 +504,7 @@ class ElementModel(QtGui.QStandardItemModel):
         element = self.element(index)
         for column, field in enumerate(self._fields):
             item_index = index.siblingAtColumn(column)
-            value = get_value(element, field.name)
+            value = field.get_value(element)
             field.refresh(value, item_index)
 
     def refresh_element(self, element: Any) -> None:
@@ -311,22 +516,28 @@ class ElementModel(QtGui.QStandardItemModel):
             self.refresh_index(index)
 
     def refresh_header(self) -> None:
-        labels = [field.label for field in self._fields]
+        labels = tuple(field.label for field in self._fields)
+        # Setting the labels repaints the header even if nothing changed.
+        if labels == self._header_labels:
+            return
+        self._header_labels = labels
         self.setHorizontalHeaderLabels(labels)
 
     def setData(
         self,
         index: QtCore.QModelIndex,
         value: Any,
-        role: ItemDataRole = ItemDataRole.EditRole,
+        role: ItemDataRole = EDIT_ROLE,
     ) -> bool:
         result = super().setData(index, value, role)
 
         # Update an element when a user changes the data in the delegate.
-        if role == ItemDataRole.EditRole:
-            if element := self.element(index):
+        # Containers are skipped, they don't pass changes on to their elements.
+        if role == EDIT_ROLE:
+            element = self.element(index)
+            if element and not isinstance(element, Container):
                 field = self._fields[index.column()]
-                value = self.data(index, ItemDataRole.EditRole)
+                value = self.data(index, EDIT_ROLE)
                 set_value(element, field.name, value)
                 self.refresh_index(index)
 
@@ -349,13 +560,20 @@ class ProxyModel(QtCore.QSortFilterProxyModel):
     def filterAcceptsRow(
         self, source_row: int, source_parent: QtCore.QModelIndex
     ) -> bool:
-        if super().filterAcceptsRow(source_row, source_parent):
-            return True
-        if self.autoAcceptChildRows() and source_parent.isValid():
+        # NOTE: Walk up the ancestors in a loop instead of recursing, each ancestor
+        #  also has to pass the checks of its own row.
+        while not super().filterAcceptsRow(source_row, source_parent):
+            if not (self.autoAcceptChildRows() and source_parent.isValid()):
+                return False
             source_row = source_parent.row()
             source_parent = source_parent.parent()
-            return self.filterAcceptsRow(source_row, source_parent)
-        return False
+            if not self._accepts_row(source_row, source_parent):
+                return False
+        return True
+
+    def _accepts_row(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
+        """Return whether the row passes the checks added by subclasses."""
+        return True
 
 
 class FilterProxyModel(ProxyModel):
@@ -372,33 +590,40 @@ class FilterProxyModel(ProxyModel):
         self._sort_roles: dict[int, ItemDataRole] = {}
         self._accept_rule = FilterProxyModel.AcceptRule.DEFAULT
 
+        # NOTE: Snapshots for filterAcceptsRow which runs for every row, they are
+        #  updated whenever the filters or the accept rule change.
+        self._active_filters: tuple[tuple[int, Filter], ...] = ()
+        self._accept_rule_result: bool | None = None
+
     def filterAcceptsRow(
         self, source_row: int, source_parent: QtCore.QModelIndex
     ) -> bool:
-        if self._accept_rule == FilterProxyModel.AcceptRule.DEFAULT:
-            pass
-        elif self._accept_rule == FilterProxyModel.AcceptRule.ALLOW_ALL:
-            return True
-        elif self._accept_rule == FilterProxyModel.AcceptRule.ALLOW_NONE:
-            return False
+        if self._accept_rule_result is not None:
+            return self._accept_rule_result
 
         if not super().filterAcceptsRow(source_row, source_parent):
             return False
-
-        for column, field_filter in self._filters.items():
-            if field_filter.match:
-                index = self.sourceModel().index(source_row, column, source_parent)
-                value = index.data(field_filter.role)
-                if not field_filter.accepts(value):
-                    return False
+        return self._accepts_row(source_row, source_parent)
+
+    def _accepts_row(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:
+        if filters := self._active_filters:
+            source_model = self.sourceModel()
+            for column, field_filter in filters:
+                if field_filter.match:
+                    index = source_model.index(source_row, column, source_parent)
+                    value = index.data(field_filter.role)
+                    if not field_filter.accepts(value):
+                        return False
         return True
 
     def lessThan(
         self, source_left: QtCore.QModelIndex, source_right: QtCore.QModelIndex
     ) -> bool:
         # NOTE: The default implementation only handles built-in types.
-        value_left = source_left.data(self.sort_role(source_left.column()))
-        value_right = source_right.data(self.sort_role(source_right.column()))
+        sort_roles = self._sort_roles
+        role = DISPLAY_ROLE
+        value_left = source_left.data(sort_roles.get(source_left.column(), role))
+        value_right = source_right.data(sort_roles.get(source_right.column(), role))
         try:
             return value_left < value_right
         except TypeError:
@@ -410,6 +635,11 @@ class FilterProxyModel(ProxyModel):
     def set_accept_rule(self, accept_rule: FilterProxyModel.AcceptRule) -> None:
         if accept_rule != self._accept_rule:
             self._accept_rule = accept_rule
+            results = {
+                FilterProxyModel.AcceptRule.ALLOW_ALL: True,
+                FilterProxyModel.AcceptRule.ALLOW_NONE: False,
+            }
+            self._accept_rule_result = results.get(accept_rule)
             self.invalidateFilter()
 
     def filter(self, column: int) -> Filter | None:
@@ -417,21 +647,29 @@ class FilterProxyModel(ProxyModel):
 
     def set_filter(self, column: int, filter_: Filter) -> None:
         self._filters[column] = filter_
+        self._refresh_active_filters()
 
     def set_filters(self, filters: dict) -> None:
-        self._filters = filters
+        # NOTE: The filters are copied, the active filters are only refreshed when
+        #  the filters are changed through the model.
+        self._filters = dict(filters)
+        self._refresh_active_filters()
 
     def remove_filter(self, column: int) -> None:
         if column in self._filters:
             del self._filters[column]
+            self._refresh_active_filters()
 
     def sort_role(self, column: int) -> int:
-        role = self._sort_roles.get(column, ItemDataRole.DisplayRole)
+        role = self._sort_roles.get(column, DISPLAY_ROLE)
         return role
 
     def set_sort_role(self, column: int, role: ItemDataRole) -> None:
         self._sort_roles[column] = role
 
+    def _refresh_active_filters(self) -> None:
+        self._active_filters = tuple(self._filters.items())
+
 
 class StyledItemDelegate(QtWidgets.QStyledItemDelegate):
     def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
@@ -458,6 +696,22 @@ class ImageDelegate(StyledItemDelegate):
     Delegate to display image thumbnails.
     """
 
+    # NOTE: Lookup tables for the option state, indexed by whether the state flag
+    #  is set. The icon mode is keyed by the enabled and selected flags.
+    _ENABLED = StateFlag.State_Enabled.value
+    _SELECTED = StateFlag.State_Selected.value
+    _OPEN = StateFlag.State_Open.value
+    _ICON_MODES = {
+        _ENABLED: QtGui.QIcon.Mode.Normal,
+        _ENABLED | _SELECTED: QtGui.QIcon.Mode.Selected,
+    }
+    _ICON_STATES = (QtGui.QIcon.State.Off, QtGui.QIcon.State.On)
+    _COLOR_GROUPS = (
+        QtGui.QPalette.ColorGroup.Disabled,
+        QtGui.QPalette.ColorGroup.Normal,
+    )
+    _COLOR_ROLES = (QtGui.QPalette.ColorRole.Window, QtGui.QPalette.ColorRole.Highlight)
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._aspect_ratio = 16 / 9
@@ -479,9 +733,12 @@ class ImageDelegate(StyledItemDelegate):
         self.initStyleOption(option, index)
         painter.save()
         painter.setClipRect(option.rect)
+        style = self._style
+        option_state = option.state
+        state_value = option_state.value
 
         # Panel
-        self._style.drawPrimitive(
+        style.drawPrimitive(
             QtWidgets.QStyle.PrimitiveElement.PE_PanelItemViewItem,
             option,
             painter,
@@ -491,37 +748,24 @@ class ImageDelegate(StyledItemDelegate):
         # Pixmap
         pixmap_rect = QtCore.QRect(option.rect)
         pixmap_rect.setSize(self._size)
-        mode = QtGui.QIcon.Mode.Normal
-        if not option.state & StateFlag.State_Enabled:
-            mode = QtGui.QIcon.Mode.Disabled
-        elif option.state & StateFlag.State_Selected:
-            mode = QtGui.QIcon.Mode.Selected
-
-        if option.state & StateFlag.State_Open == StateFlag.State_Open:
-            state = QtGui.QIcon.State.On
-        else:
-            state = QtGui.QIcon.State.Off
+        mode = self._ICON_MODES.get(
+            state_value & (self._ENABLED | self._SELECTED), QtGui.QIcon.Mode.Disabled
+        )
+        state = self._ICON_STATES[bool(state_value & self._OPEN)]
         option.icon.paint(painter, pixmap_rect, option.decorationAlignment, mode, state)
 
         # Focus Rect
-        if option.state & StateFlag.State_HasFocus:
+        if option_state & StateFlag.State_HasFocus:
             option_focus = QtWidgets.QStyleOptionFocusRect()
             option_focus.rect = option.rect
-            option_focus.state = option.state
+            option_focus.state = option_state
             option_focus.state |= StateFlag.State_KeyboardFocusChange
             option_focus.state |= StateFlag.State_Item
 
-            if option.state & StateFlag.State_Enabled:
-                color_group = QtGui.QPalette.ColorGroup.Normal
-            else:
-                color_group = QtGui.QPalette.ColorGroup.Disabled
-
-            if option.state & StateFlag.State_Selected:
-                role = QtGui.QPalette.ColorRole.Highlight
-            else:
-                role = QtGui.QPalette.ColorRole.Window
+            color_group = self._COLOR_GROUPS[bool(state_value & self._ENABLED)]
+            role = self._COLOR_ROLES[bool(state_value & self._SELECTED)]
             option_focus.backgroundColor = option.palette.color(color_group, role)
-            self._style.drawPrimitive(
+            style.drawPrimitive(
                 QtWidgets.QStyle.PrimitiveElement.PE_FrameFocusRect,
                 option_focus,
                 painter,
@@ -611,6 +855,10 @@ class ElementTree(QtWidgets.QTreeView):
         self.header().setStretchLastSection(True)
         self.header().sectionResized.connect(self._header_resized)
 
+        # NOTE: Build the default thumbnail up front, so the first image cell
+        #  doesn't have to draw it while painting.
+        prewarm_default_thumbnail()
+
         # self.proxy_style = MaterialStyle(self.header().style().objectName())
         # self.proxy_style.setParent(self.header())
         # self.header().setStyle(self.proxy_style)
@@ -623,32 +871,63 @@ class ElementTree(QtWidgets.QTreeView):
 
     def resize_columns(self, padding: int = 8) -> None:
         model = self.model()
-        if model and model.rowCount():
+        if not model or not model.rowCount():
+            return
+
+        # NOTE: The delegates are only updated once for the final width of each
+        #  column instead of for every intermediate resize.
+        header = self.header()
+        header.sectionResized.disconnect(self._header_resized)
+        self.setUpdatesEnabled(False)
+        try:
             self.expandAll()
             for column in range(model.columnCount()):
+                old = self.columnWidth(column)
                 self.resizeColumnToContents(column)
                 if padding:
                     width = self.columnWidth(column) + padding
                     self.setColumnWidth(column, width)
+                new = self.columnWidth(column)
+                if new != old:
+                    self._header_resized(column, old, new)
             self.collapseAll()
+        finally:
+            header.sectionResized.connect(self._header_resized)
+            self.setUpdatesEnabled(True)
 
     def _header_resized(self, column: int, old: int, new: int) -> None:
         delegate = self.itemDelegateForColumn(column)
         if isinstance(delegate, ImageDelegate):
             delegate.set_width(new)
             if new < delegate.max_width():
-                for row in range(self.model().rowCount()):
-                    index = self.model().index(row, column)
-                    delegate.sizeHintChanged.emit(index)
+                # NOTE: Every sizeHintChanged signal lays out all items again, a
+                #  delayed layout is only done once for all rows.
+                self.scheduleDelayedItemsLayout()
+
+
+_thumbnail_cache: dict[int, QtGui.QPixmap] = {}
 
 
-@cache
 def get_default_thumbnail() -> QtGui.QPixmap:
+    palette = QtWidgets.QApplication.palette()
+    key = palette.cacheKey()
+    pixmap = _thumbnail_cache.get(key)
+    if pixmap is None:
+        # NOTE: Thumbnails of a previous palette are not used again.
+        _thumbnail_cache.clear()
+        pixmap = _thumbnail_cache[key] = _create_default_thumbnail(palette)
+    return pixmap
+
+
+def prewarm_default_thumbnail() -> None:
+    get_default_thumbnail()
+
+
+def _create_default_thumbnail(palette: QtGui.QPalette) -> QtGui.QPixmap:
     size = QtCore.QSize(192, 108)
     icon_size = QtCore.QSize(48, 48)
 
     pixmap = QtGui.QPixmap(size)
-    palette = QtWidgets.QApplication.palette()
     color = palette.color(
         QtGui.QPalette.ColorGroup.Normal, QtGui.QPalette.ColorRole.Shadow
     )